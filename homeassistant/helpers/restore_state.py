@@ -15,7 +15,7 @@ import homeassistant.util.dt as dt_util
 
 RECORDER_TIMEOUT = 10
 DATA_RESTORE_CACHE = 'restore_state_cache'
-_LOCK = 'restore_lock'
+DATA_RESTORE_CACHE_TASK = 'restore_state_cache_task'
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,6 +25,7 @@ def _load_restore_cache(hass: HomeAssistant):
     def remove_cache(event):
         """Remove the states cache."""
         hass.data.pop(DATA_RESTORE_CACHE, None)
+        hass.data.pop(DATA_RESTORE_CACHE_TASK, None)
 
     hass.bus.listen_once(EVENT_HOMEASSISTANT_START, remove_cache)
 
@@ -72,13 +73,25 @@ async def async_get_last_state(hass, entity_id: str):
     if not connected:
         return None
 
-    if _LOCK not in hass.data:
-        hass.data[_LOCK] = asyncio.Lock(loop=hass.loop)
+    # Concurrent callers during startup all wait on the same load job
+    task = hass.data.get(DATA_RESTORE_CACHE_TASK)
 
-    async with hass.data[_LOCK]:
-        if DATA_RESTORE_CACHE not in hass.data:
-            await hass.async_add_job(
-                _load_restore_cache, hass)
+    if task is None:
+        task = hass.data[DATA_RESTORE_CACHE_TASK] = hass.async_add_job(
+            _load_restore_cache, hass)
+
+        @callback
+        def forget_failed_load(fut):
+            """Allow a later caller to retry a failed or cancelled load."""
+            if hass.data.get(DATA_RESTORE_CACHE_TASK) is not fut:
+                return
+            if fut.cancelled() or fut.exception() is not None:
+                hass.data.pop(DATA_RESTORE_CACHE_TASK)
+
+        task.add_done_callback(forget_failed_load)
+
+    # Shield so a cancelled caller does not cancel the load for the others
+    await asyncio.shield(task, loop=hass.loop)
 
     return hass.data.get(DATA_RESTORE_CACHE, {}).get(entity_id)
 
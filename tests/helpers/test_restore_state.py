@@ -1,8 +1,11 @@
 """The tests for the Restore component."""
 import asyncio
 from datetime import timedelta
+import threading
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from homeassistant.setup import setup_component
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import CoreState, split_entity_id, State
@@ -51,6 +54,74 @@ def test_caching_data(hass):
     assert DATA_RESTORE_CACHE not in hass.data
 
 
+@asyncio.coroutine
+def test_cancelled_caller_does_not_cancel_load(hass):
+    """Test that cancelling one waiting caller does not affect the others."""
+    mock_component(hass, 'recorder')
+    hass.state = CoreState.starting
+
+    states = [
+        State('input_boolean.b0', 'on'),
+        State('input_boolean.b1', 'off'),
+    ]
+    load_blocker = threading.Event()
+
+    def blocked_get_states(*args, **kwargs):
+        """Block the executor until the test releases the load."""
+        load_blocker.wait()
+        return states
+
+    with patch('homeassistant.helpers.restore_state.last_recorder_run',
+               return_value=MagicMock(end=dt_util.utcnow())), \
+            patch('homeassistant.helpers.restore_state.get_states',
+                  side_effect=blocked_get_states) as mock_get_states, \
+            patch('homeassistant.helpers.restore_state.wait_connection_ready',
+                  side_effect=lambda hass: mock_coro(True)):
+        task_b0 = hass.async_create_task(
+            async_get_last_state(hass, 'input_boolean.b0'))
+        task_b1 = hass.async_create_task(
+            async_get_last_state(hass, 'input_boolean.b1'))
+
+        # Let both callers start waiting on the blocked load
+        for _ in range(10):
+            yield from asyncio.sleep(0, loop=hass.loop)
+
+        task_b0.cancel()
+        for _ in range(10):
+            yield from asyncio.sleep(0, loop=hass.loop)
+        load_blocker.set()
+        state = yield from task_b1
+
+    assert task_b0.cancelled()
+    assert state is not None
+    assert state.state == 'off'
+    assert len(mock_get_states.mock_calls) == 1
+
+
+@asyncio.coroutine
+def test_failed_load_is_retried(hass):
+    """Test that a failed cache load is retried by the next caller."""
+    mock_component(hass, 'recorder')
+    hass.state = CoreState.starting
+
+    states = [State('input_boolean.b1', 'on')]
+
+    with patch('homeassistant.helpers.restore_state.last_recorder_run',
+               return_value=MagicMock(end=dt_util.utcnow())), \
+            patch('homeassistant.helpers.restore_state.get_states',
+                  side_effect=[ValueError, states]) as mock_get_states, \
+            patch('homeassistant.helpers.restore_state.wait_connection_ready',
+                  side_effect=lambda hass: mock_coro(True)):
+        with pytest.raises(ValueError):
+            yield from async_get_last_state(hass, 'input_boolean.b1')
+
+        state = yield from async_get_last_state(hass, 'input_boolean.b1')
+
+    assert state is not None
+    assert state.state == 'on'
+    assert len(mock_get_states.mock_calls) == 2
+
+
 @asyncio.coroutine
 def test_hass_running(hass):
     """Test that cache cannot be accessed while hass is running."""